@@ -1,10 +1,28 @@
+import os
 from setuptools import setup, find_packages
 
+# Opt-in: compile the AST-walking validators to C extensions with mypyc.
+# The pure-Python modules remain the default and behave identically.
+ext_modules = []
+if os.environ.get("LANGSEC_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "src/langsec/validators/facts.py",
+            "src/langsec/validators/base.py",
+            "src/langsec/validators/column.py",
+            "src/langsec/validators/join.py",
+            "src/langsec/validators/aggregation.py",
+        ]
+    )
+
 setup(
     name="langsec",
     version="0.0.1",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
     install_requires=[
         "sqlglot>=11.5.0",
         "pydantic>=2.0.0",
@@ -14,6 +32,9 @@ setup(
         "pytest>=7.0.0",
     ],
     extras_require={
+        "rs": [
+            "sqlglot[rs]>=20.3.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "black>=23.0.0",
@@ -1,11 +1,23 @@
-from .core.security import SQLSecurityGuard
+from typing import TYPE_CHECKING
 from .schema.security_schema import SecuritySchema
 from .config import LangSecConfig
 from .exceptions.errors import LangSecError
 
+if TYPE_CHECKING:
+    from .core.security import SQLSecurityGuard
+
 __all__ = [
     "SQLSecurityGuard",
     "SecuritySchema",
     "LangSecConfig",
     "LangSecError",
 ]
+
+
+def __getattr__(name: str):
+    # The guard imports sqlglot, so it is only loaded once it is first used
+    if name == "SQLSecurityGuard":
+        from .core.security import SQLSecurityGuard
+
+        return SQLSecurityGuard
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,3 +8,4 @@ class LangSecConfig(BaseModel):
     log_queries: bool = False
     log_path: Optional[str] = None
     raise_on_violation: bool = True
+    cache_size: int = 1024
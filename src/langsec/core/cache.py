@@ -0,0 +1,47 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple, Type, Union
+
+from ..exceptions.errors import LangSecError
+
+# A cached outcome is either True (query passed) or the exception type and args
+# needed to re-raise the original violation.
+CachedOutcome = Union[bool, Tuple[Type[LangSecError], tuple]]
+
+
+class ValidationCache:
+    """Bounded, thread-safe LRU cache mapping queries to their validation outcome."""
+
+    __slots__ = ("maxsize", "_entries", "_lock")
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, CachedOutcome]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CachedOutcome]:
+        """Returns the cached outcome for a key, or None if not cached."""
+        with self._lock:
+            outcome = self._entries.get(key)
+            if outcome is not None:
+                self._entries.move_to_end(key)
+            return outcome
+
+    def put(self, key: Hashable, outcome: CachedOutcome) -> None:
+        """Stores an outcome, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = outcome
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all cached outcomes."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,9 +1,12 @@
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Union
 from ..schema.security_schema import SecuritySchema
 from ..config import LangSecConfig
 from ..validators.query import QueryValidator
 from ..validators.injection import SQLInjectionValidator
+from ..exceptions.errors import LangSecError
+from .cache import ValidationCache
 
 
 class SQLSecurityGuard:
@@ -17,8 +20,9 @@ class SQLSecurityGuard:
         self.schema = schema or SecuritySchema()
         self.config = config or LangSecConfig()
 
-        self.query_validator = QueryValidator(schema, config)
         self.injection_validator = SQLInjectionValidator()
+        self._cache = ValidationCache(self.config.cache_size)
+        self._compile_schema()
 
         if self.config.log_queries:
             self._setup_logging()
@@ -39,7 +43,7 @@ class SQLSecurityGuard:
         """
         try:
             if self.config.log_queries:
-                self.logger.info(f"Validating query: {query}")
+                self.logger.info("Validating query: %s", query)
 
             # Validate against schema if provided
             if (
@@ -51,7 +55,7 @@ class SQLSecurityGuard:
                     "Must provide tables, default_table_security_schema or default_column_security_schema"
                 )
 
-            self.query_validator.validate(query)
+            self._validate_cached(query)
 
             if self.config.log_queries:
                 self.logger.info("Query validation successful")
@@ -60,8 +64,78 @@ class SQLSecurityGuard:
 
         except Exception as e:
             if self.config.log_queries:
-                self.logger.error(f"Query validation failed: {str(e)}")
+                self.logger.error("Query validation failed: %s", e)
 
             if self.config.raise_on_violation:
                 raise
             return False
+
+    def validate_many(
+        self, queries: Iterable[str], workers: Optional[int] = None
+    ) -> List[Union[bool, Exception]]:
+        """
+        Validates several queries, on a thread pool of the given size if
+        workers is set and inline otherwise. Validation holds the GIL, so the
+        pool gives no speedup on CPython.
+        Returns, in input order, each query's validate_query result, or the
+        exception it raised instead of raising it. Repeated queries are
+        validated once and share their result.
+        """
+        queries = list(queries)
+        unique_queries = list(dict.fromkeys(queries))
+        if workers is None or workers == 1 or len(unique_queries) <= 1:
+            outcomes = [self._validate_or_capture(query) for query in unique_queries]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(self._validate_or_capture, unique_queries))
+
+        results = dict(zip(unique_queries, outcomes))
+        return [results[query] for query in queries]
+
+    def _validate_or_capture(self, query: str) -> Union[bool, Exception]:
+        """Validates a query, returning the raised exception instead of raising."""
+        try:
+            return self.validate_query(query)
+        except Exception as e:
+            return e
+
+    def _compile_schema(self) -> None:
+        """
+        Builds the query validator for the current schema and drops outcomes
+        cached for any previous schema revision.
+        """
+        self.query_validator = QueryValidator(self.schema, self.config)
+        self._schema_revision = self.schema.revision
+        self._cache.clear()
+
+    def _validate_cached(self, query: str) -> None:
+        """
+        Runs the query validator, reusing the outcome of previous validations
+        of the same query. Violations are cached and re-raised as new instances.
+        """
+        if (
+            self.query_validator.schema is not self.schema
+            or self.schema.revision != self._schema_revision
+        ):
+            self._compile_schema()
+
+        outcome = self._cache.get(query)
+        if outcome is None:
+            try:
+                self.query_validator.validate(query)
+                outcome = True
+            except LangSecError as e:
+                outcome = (type(e), e.args)
+            self._cache.put(query, outcome)
+
+        if outcome is not True:
+            error_type, args = outcome  # type: ignore[misc]
+            raise error_type(*args)
+
+    def clear_cache(self) -> None:
+        """
+        Recompiles the schema and clears cached validation outcomes. Assigning
+        fields of the root schema is picked up automatically; call this after
+        changing tables, columns or keyword sets in place.
+        """
+        self._compile_schema()
@@ -0,0 +1,55 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+from sqlglot import exp, parse_one
+from sqlglot.errors import ParseError, SqlglotError
+
+if TYPE_CHECKING:
+    from functools import _CacheInfo
+
+# What is needed to raise a fresh copy of a tokenizer or parser error: its
+# type, message and, for a ParseError, its error details. The raised instance
+# is not cached, so its traceback and the parser frames it references are not
+# kept alive by the cache.
+_CachedParseError = Tuple[Type[SqlglotError], str, Optional[List[Dict[str, Any]]]]
+
+
+@lru_cache(maxsize=8192)
+def _parse_outcome(
+    query: str, dialect: Optional[str] = None
+) -> Union[exp.Expression, _CachedParseError]:
+    """Parses a single SQL statement, returning the error instead of raising."""
+    try:
+        return parse_one(query, dialect=dialect)
+    except ParseError as e:
+        return type(e), str(e), e.errors
+    except SqlglotError as e:
+        return type(e), str(e), None
+
+
+def parse(query: str, dialect: Optional[str] = None) -> exp.Expression:
+    """
+    Parses a single SQL statement, caching the result process-wide.
+
+    The parse only depends on the query and dialect, so every guard shares the
+    cache. The returned expression is shared between callers and must be
+    treated as read-only; use .copy() before transforming it. Tokenizer and
+    parse errors are cached as well and re-raised as a new exception on every
+    call.
+    """
+    outcome = _parse_outcome(query, dialect)
+    if isinstance(outcome, tuple):
+        error_type, message, errors = outcome
+        if errors is None:
+            raise error_type(message)
+        raise error_type(message, list(errors))
+    return outcome
+
+
+def cache_info() -> "_CacheInfo":
+    """Returns hit and miss statistics of the process-wide parse cache."""
+    return _parse_outcome.cache_info()
+
+
+def clear_cache() -> None:
+    """Empties the process-wide parse cache."""
+    _parse_outcome.cache_clear()
@@ -0,0 +1,171 @@
+import sys
+from typing import Dict, FrozenSet, Tuple
+
+from .security_schema import (
+    ColumnSchema,
+    SecuritySchema,
+    TableSchema,
+    operations_mask,
+)
+from .sql.enums import AggregationType, Access, JoinType, Operation
+
+
+def _key(name: str) -> str:
+    return sys.intern(name.lower())
+
+
+def _join_rules(table: TableSchema) -> Dict[str, FrozenSet[JoinType]]:
+    return {
+        _key(other): frozenset(join_types)
+        for other, join_types in table.allowed_joins.items()
+    }
+
+
+class ColumnRule:
+    """
+    Slotted copy of the ColumnSchema fields checked for every column reference.
+    Reading it avoids pydantic attribute lookups. The operations mask is built
+    from the copied allowed_operations, so the two never disagree.
+    """
+
+    __slots__ = (
+        "access",
+        "allowed_operations",
+        "allowed_aggregations",
+        "operations_mask",
+    )
+
+    def __init__(self, column: ColumnSchema):
+        self.access: Access = column.access
+        self.allowed_operations: FrozenSet[Operation] = frozenset(
+            column.allowed_operations
+        )
+        self.allowed_aggregations: FrozenSet[AggregationType] = frozenset(
+            column.allowed_aggregations
+        )
+        self.operations_mask: int = operations_mask(self.allowed_operations)
+
+
+class CompiledSchema:
+    """
+    Flat, read-only lookup tables built once from a SecuritySchema.
+
+    Validators resolve column and join rules with a single hash probe on
+    lower-cased names instead of descending through the nested schema models.
+    Fallbacks mirror SecuritySchema.get_column_schema and
+    TableSchema.get_table_allowed_joins.
+
+    Rules are copied when the schema is compiled, so in-place changes to nested
+    tables and columns only take effect once the schema is compiled again.
+    """
+
+    __slots__ = (
+        "schema",
+        "table_names",
+        "default_column",
+        "selectable_columns",
+        "deletable_tables",
+        "restricts_aggregations",
+        "_columns",
+        "_joins",
+        "_table_default_joins",
+        "_allowed_joins",
+        "_default_table_columns",
+        "_default_table_joins",
+        "_default_table_default_join",
+    )
+
+    def __init__(self, schema: SecuritySchema):
+        self.schema = schema
+        self.table_names: FrozenSet[str] = frozenset(
+            _key(name) for name in schema.tables
+        )
+
+        self.default_column = ColumnRule(schema.default_column_security_schema)
+        self._columns: Dict[Tuple[str, str], ColumnRule] = {}
+        self._joins: Dict[Tuple[str, str], FrozenSet[JoinType]] = {}
+        self._table_default_joins: Dict[str, FrozenSet[JoinType]] = {}
+
+        for name, table in schema.tables.items():
+            table_name = _key(name)
+            for column_name, column in table.columns.items():
+                self._columns[(table_name, _key(column_name))] = ColumnRule(column)
+            for other, join_types in _join_rules(table).items():
+                self._joins[(table_name, other)] = join_types
+            self._table_default_joins[table_name] = frozenset(
+                table.default_allowed_join or ()
+            )
+
+        # Columns with explicit rules that neither deny access nor forbid SELECT
+        self.selectable_columns: FrozenSet[Tuple[str, str]] = frozenset(
+            key
+            for key, column in self._columns.items()
+            if column.access != Access.DENIED
+            and Operation.SELECT in column.allowed_operations
+        )
+
+        # Tables with at least one explicit column rule that allows DELETE
+        self.deletable_tables: FrozenSet[str] = frozenset(
+            table_name
+            for (table_name, _), column in self._columns.items()
+            if Operation.DELETE in column.allowed_operations
+        )
+
+        # Every explicitly allowed (table, other table, join type) combination
+        self._allowed_joins: FrozenSet[Tuple[str, str, JoinType]] = frozenset(
+            (table_name, other, join_type)
+            for (table_name, other), join_types in self._joins.items()
+            for join_type in join_types
+        )
+
+        # Tables missing from the schema use the default table schema
+        default_table = schema.default_table_security_schema
+        self._default_table_columns: Dict[str, ColumnRule] = {
+            _key(column_name): ColumnRule(column)
+            for column_name, column in default_table.columns.items()
+        }
+        self._default_table_joins = _join_rules(default_table)
+        self._default_table_default_join: FrozenSet[JoinType] = frozenset(
+            default_table.default_allowed_join or ()
+        )
+
+        # Whether any column rule, explicit or default, limits aggregations
+        self.restricts_aggregations = any(
+            rule.allowed_aggregations
+            for rules in (self._columns.values(), self._default_table_columns.values())
+            for rule in rules
+        ) or bool(self.default_column.allowed_aggregations)
+
+    def has_table(self, table_name: str) -> bool:
+        """Returns whether a lower-cased table name is defined in the schema."""
+        return table_name in self.table_names
+
+    def column_rule(self, table_name: str, column_name: str) -> ColumnRule:
+        """Returns the rules for a lower-cased table and column name."""
+        column = self._columns.get((table_name, column_name))
+        if column is not None:
+            return column
+        if table_name in self.table_names:
+            return self.default_column
+        return self._default_table_columns.get(column_name, self.default_column)
+
+    def join_rule(self, table_name: str, other_table: str) -> FrozenSet[JoinType]:
+        """Returns the join types allowed from one lower-cased table to another."""
+        join_types = self._joins.get((table_name, other_table))
+        if join_types is not None:
+            return join_types
+        if table_name in self.table_names:
+            return self._table_default_joins[table_name]
+        return self._default_table_joins.get(
+            other_table, self._default_table_default_join
+        )
+
+    def allows_join(
+        self, table_name: str, other_table: str, join_type: JoinType
+    ) -> bool:
+        """Returns whether a join type is allowed from one lower-cased table."""
+        if (table_name, other_table, join_type) in self._allowed_joins:
+            return True
+        if (table_name, other_table) in self._joins:
+            return False
+        return join_type in self.join_rule(table_name, other_table)
@@ -1,8 +1,46 @@
-from typing import Dict, Optional, Set, Union
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+import sys
+from typing import Dict, Iterable, Mapping, Optional, Set, TypeVar, Union
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 
 from .sql.enums import AggregationType, Access, JoinType, Operation
 
+T = TypeVar("T")
+
+# Each operation owns one bit, so sets of operations can be compared as ints
+OPERATION_BITS: Dict[Operation, int] = {
+    operation: 1 << i for i, operation in enumerate(Operation)
+}
+OPERATIONS_BY_BIT: Dict[int, Operation] = {
+    bit: operation for operation, bit in OPERATION_BITS.items()
+}
+
+
+def operations_mask(operations: Iterable[Operation]) -> int:
+    """Returns the bitmask with the bit of every given operation set."""
+    mask = 0
+    for operation in operations:
+        mask |= OPERATION_BITS[operation]
+    return mask
+
+
+def _find(schemas: Mapping[str, T], name: str) -> Optional[T]:
+    """Returns the schema stored under a name, ignoring case."""
+    schema = schemas.get(name)
+    if schema is not None:
+        return schema
+    name = name.lower()
+    for key, schema in schemas.items():
+        if key.lower() == name:
+            return schema
+    return None
+
 
 class ColumnSchema(BaseModel):
     """Schema defining security rules for a database column."""
@@ -13,12 +51,22 @@ class ColumnSchema(BaseModel):
 
     model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
 
+    @property
+    def operations_mask(self) -> int:
+        """Bitmask of the allowed operations, see OPERATION_BITS."""
+        return operations_mask(self.allowed_operations)
+
     @classmethod
     def create_default(cls, **kwargs) -> "ColumnSchema":
         """Create a default column schema with optional overrides."""
         valid_fields = {k: v for k, v in kwargs.items() if k in cls.model_fields}
         return cls(**valid_fields)
 
+    @classmethod
+    def unchecked(cls, **kwargs) -> "ColumnSchema":
+        """Create a column schema from trusted values, skipping validation."""
+        return cls.model_construct(**kwargs)
+
 
 class TableSchema(BaseModel):
     """Schema defining security rules for a database table."""
@@ -60,6 +108,11 @@ class TableSchema(BaseModel):
         valid_fields = {k: v for k, v in kwargs.items() if k in cls.model_fields}
         return cls(**valid_fields)
 
+    @classmethod
+    def unchecked(cls, **kwargs) -> "TableSchema":
+        """Create a table schema from trusted values, skipping validation."""
+        return cls.model_construct(**kwargs)
+
 
 class SecuritySchema(BaseModel):
     """Schema defining overall security rules for database access."""
@@ -95,6 +148,8 @@ class SecuritySchema(BaseModel):
 
     model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
 
+    _revision: int = PrivateAttr(default=0)
+
     def __init__(self, **data):
         # Initialize default schemas before parent initialization
         column_fields = {
@@ -149,16 +204,34 @@ class SecuritySchema(BaseModel):
             prompt += f"- Default access level: {self.access.name}\n"
         return prompt
 
+    @property
+    def revision(self) -> int:
+        """Counter bumped each time the schema is validated, including on assignment."""
+        # Read on every validate_query call; going through the private storage
+        # directly skips pydantic's __getattr__ fallback for private attributes
+        return self.__pydantic_private__["_revision"]  # type: ignore[index]
+
     def get_table_schema(self, table_name: str) -> TableSchema:
         """Returns the table schema, or the default if not found."""
-        return self.tables.get(table_name, self.default_table_security_schema)
+        table = _find(self.tables, table_name)
+        return table if table is not None else self.default_table_security_schema
 
     def get_column_schema(self, table_name: str, column_name: str) -> ColumnSchema:
         """Returns the column schema, or the default if not found."""
-        table_schema = self.get_table_schema(table_name)
-        return table_schema.columns.get(
-            column_name, self.default_column_security_schema
-        )
+        column = _find(self.get_table_schema(table_name).columns, column_name)
+        return column if column is not None else self.default_column_security_schema
+
+    @field_validator("forbidden_keywords")
+    @classmethod
+    def normalize_forbidden_keywords(cls, v: Set[str]) -> Set[str]:
+        """Upper-cases and interns forbidden keywords, which match case-insensitively."""
+        return {sys.intern(keyword.upper()) for keyword in v}
+
+    @model_validator(mode="after")
+    def bump_revision(self) -> "SecuritySchema":
+        """Marks the schema as changed, see revision."""
+        self._revision += 1
+        return self
 
     @field_validator("tables", mode="before")
     @classmethod
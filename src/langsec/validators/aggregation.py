@@ -1,21 +1,38 @@
+from typing import Optional
 from sqlglot import exp
-from sqlglot.expressions import AggFunc
 from .base import BaseQueryValidator
+from .facts import QueryFacts
 from ..schema.sql.enums import AggregationType
 from ..exceptions.errors import QueryComplexityError
 
+# Aggregation functions that can be restricted per column
+_AGGREGATION_TYPES = {
+    exp.Sum: AggregationType.SUM,
+    exp.Avg: AggregationType.AVG,
+    exp.Min: AggregationType.MIN,
+    exp.Max: AggregationType.MAX,
+    exp.Count: AggregationType.COUNT,
+}
+
 
 class AggregationValidator(BaseQueryValidator):
-    def validate(self, parsed: exp.Expression) -> None:
+    def is_needed(self) -> bool:
+        return self.compiled.restricts_aggregations
+
+    def validate(
+        self, parsed: exp.Expression, facts: Optional[QueryFacts] = None
+    ) -> None:
         """Validates aggregation functions against schema rules."""
-        all_aggregations = AggFunc.__subclasses__()
-        for agg in parsed.find_all(*all_aggregations):
+        facts = facts or QueryFacts(parsed)
+        for agg in facts.aggregations:
             for column in agg.find_all(exp.Column):
                 table_name = column.table or self._get_default_table(agg, column)
                 if not table_name:
                     continue
 
-                column_rule = self.schema.get_column_schema(table_name, column.name)
+                column_rule = self.compiled.column_rule(
+                    table_name.lower(), column.name.lower()
+                )
                 if column_rule and column_rule.allowed_aggregations:
                     agg_type = self._get_aggregation_type(agg)
                     if agg_type not in column_rule.allowed_aggregations:
@@ -25,11 +42,4 @@ class AggregationValidator(BaseQueryValidator):
 
     def _get_aggregation_type(self, agg: exp.Expression) -> AggregationType:
         """Maps sqlglot aggregation to AggregationType."""
-        agg_map = {
-            exp.Sum: AggregationType.SUM,
-            exp.Avg: AggregationType.AVG,
-            exp.Min: AggregationType.MIN,
-            exp.Max: AggregationType.MAX,
-            exp.Count: AggregationType.COUNT,
-        }
-        return agg_map.get(type(agg))  # type: ignore
+        return _AGGREGATION_TYPES.get(type(agg))  # type: ignore
@@ -1,21 +1,51 @@
-from typing import Optional, Union
+from typing import List, Optional, Union
 from sqlglot import exp
+from ..schema.compiled import CompiledSchema
 from ..schema.security_schema import SecuritySchema
+from .facts import QueryFacts
 from abc import ABC, abstractmethod
 
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:  # Only needed when building with mypyc
 
+    def mypyc_attr(*attrs, **kwattrs):  # type: ignore[no-redef,misc]
+        return lambda cls: cls
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class BaseQueryValidator(ABC):
-    def __init__(self, schema: Optional[SecuritySchema] = None):
+    def __init__(
+        self,
+        schema: Optional[SecuritySchema] = None,
+        compiled: Optional[CompiledSchema] = None,
+    ):
         self.schema = schema or SecuritySchema()
+        self.compiled = compiled or CompiledSchema(self.schema)
 
     @abstractmethod
-    def validate(self, parsed: exp.Expression) -> None:
-        """Validates the given SQL query."""
+    def validate(
+        self, parsed: exp.Expression, facts: Optional[QueryFacts] = None
+    ) -> None:
+        """
+        Validates the given SQL query. Validators that inspect specific nodes
+        read them from facts, which is collected from parsed if not provided.
+        """
+
+    def is_needed(self) -> bool:
+        """Whether the schema enables any rule checked by this validator."""
+        return True
 
     def _get_default_table(
-        self, parsed: exp.Expression, column_hint: Union[exp.Column, None]
+        self,
+        parsed: exp.Expression,
+        column_hint: Union[exp.Column, None],
+        tables: Optional[List[exp.Table]] = None,
     ) -> Optional[str]:
-        """Gets the default table when column table is not specified."""
+        """
+        Gets the default table when column table is not specified.
+        tables, if given, must be every table in parsed, e.g. QueryFacts.tables.
+        """
         # Sometimes we can get the table name straight from the expression
         if parsed.parent_select is not None:
             parent_select = parsed.parent_select
@@ -36,7 +66,8 @@ class BaseQueryValidator(ABC):
                 break
             parent = parent.parent
 
-        tables = list(parsed.find_all(exp.Table))
+        if tables is None:
+            tables = list(parsed.find_all(exp.Table))
         if len(tables) == 1:
             return str(tables[0].name).lower()
 
@@ -1,9 +1,34 @@
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple, Type
 from sqlglot import exp
 from .base import BaseQueryValidator
+from .facts import QueryFacts
+from ..schema.security_schema import (
+    OPERATION_BITS,
+    OPERATIONS_BY_BIT,
+    operations_mask,
+)
 from ..schema.sql.enums import Access, Operation
 from ..exceptions.errors import ColumnAccessError
 
+_SELECT_BIT = OPERATION_BITS[Operation.SELECT]
+
+# Ancestor node types that determine a column's operations. Subclasses match
+# too, like with isinstance; the operation per concrete type is cached lazily.
+_OPERATION_NODES: Tuple[Tuple[Tuple[Type[exp.Expression], ...], Operation], ...] = (
+    ((exp.Select, exp.Subquery), Operation.SELECT),
+    ((exp.Update,), Operation.UPDATE),
+    ((exp.Insert,), Operation.INSERT),
+)
+_OPERATION_BY_TYPE: Dict[Type[exp.Expression], Optional[Operation]] = {}
+
+
+def _resolve_operation(node_type: Type[exp.Expression]) -> Optional[Operation]:
+    """Returns the operation an ancestor of the given type implies, if any."""
+    for types, operation in _OPERATION_NODES:
+        if issubclass(node_type, types):
+            return operation
+    return None
+
 
 class ColumnValidator(BaseQueryValidator):
     def _resolve_table_name(
@@ -15,98 +40,115 @@ class ColumnValidator(BaseQueryValidator):
                 return table.name.lower()
         return None
 
-    def _get_table_aliases(self, parsed: exp.Expression) -> Dict[str, str]:
-        """Get mapping of aliases to actual table names."""
-        aliases = {}
-        for table in parsed.find_all(exp.Table):
-            if table.alias:
-                aliases[table.alias.lower()] = table.name.lower()
-        return aliases
-
     def _get_column_operations(
-        self, column: exp.Column, parsed: exp.Expression
-    ) -> Set[str]:
+        self, column: exp.Column, column_name: str, facts: QueryFacts
+    ) -> Set[Operation]:
         """
         Determine all operations being performed on a column, including in nested queries.
+        The column name is expected lower-cased.
         Returns a set of operations (SELECT, UPDATE, INSERT, DELETE).
         """
-        operations = set()
-        current_node = column
+        operations: Set[Operation] = set()
+        current_node: Optional[exp.Expression] = column
 
         # First, check if we're in a DELETE context
-        delete_node = parsed.find(exp.Delete)
-        if delete_node:
+        if facts.deletes:
             # For DELETE queries, we need both DELETE and SELECT permissions
             operations.add(Operation.DELETE)
             operations.add(Operation.SELECT)  # For WHERE clause evaluation
 
         # Traverse up the tree to find all relevant operations
         while current_node:
-            if isinstance(current_node, (exp.Select, exp.Subquery)):
+            node_type = type(current_node)
+            try:
+                node_operation = _OPERATION_BY_TYPE[node_type]
+            except KeyError:
+                node_operation = _OPERATION_BY_TYPE[node_type] = _resolve_operation(
+                    node_type
+                )
+
+            if node_operation == Operation.SELECT:
                 operations.add(Operation.SELECT)
-            elif isinstance(current_node, exp.Update):
+            elif node_operation == Operation.UPDATE:
                 if hasattr(current_node, "expressions"):
                     for expr in current_node.expressions:
                         if (
                             isinstance(expr, exp.EQ)
                             and isinstance(expr.left, exp.Column)
-                            and expr.left.name.lower() == column.name.lower()
+                            and expr.left.name.lower() == column_name
                         ):
                             operations.add(Operation.UPDATE)
                             break
                 operations.add(Operation.SELECT)
-            elif isinstance(current_node, exp.Insert):
+            elif node_operation == Operation.INSERT:
                 if hasattr(current_node, "expressions"):
                     for col in current_node.expressions:
                         if (
                             isinstance(col, exp.Column)
-                            and col.name.lower() == column.name.lower()
+                            and col.name.lower() == column_name
                         ):
                             operations.add(Operation.INSERT)
                             break
-                if current_node.find(exp.Select):
+                # Selects of the whole query were collected by the facts walk
+                if (
+                    facts.selects
+                    if current_node is facts.parsed
+                    else current_node.find(exp.Select)
+                ):
                     operations.add(Operation.SELECT)
 
             current_node = current_node.parent
 
         return operations
 
-    def validate(self, parsed: exp.Expression) -> None:
-        aliases = self._get_table_aliases(parsed)
-        write_columns = self._get_write_columns(parsed, aliases)
+    def validate(
+        self, parsed: exp.Expression, facts: Optional[QueryFacts] = None
+    ) -> None:
+        facts = facts or QueryFacts(parsed)
+        aliases = facts.table_aliases
+        write_columns = self._get_write_columns(parsed, facts, aliases)
+
+        # Without DML nodes a column can at most be selected, so columns that
+        # allow SELECT need no walk up the tree to collect their operations
+        select_only = not (facts.updates or facts.inserts or facts.deletes)
 
         # Special handling for DELETE operations
-        if parsed.find(exp.Delete):
+        if facts.deletes:
             table_name = None
-            delete_node = parsed.find(exp.Delete)
+            delete_node = facts.deletes[0]
             if hasattr(delete_node, "this") and isinstance(delete_node.this, exp.Table):  # type: ignore
                 table_name = delete_node.this.name.lower()  # type: ignore
 
                 # Check if any column in the table has DELETE permission
-                table_schema = self.schema.tables.get(table_name)
-                if table_schema:
-                    has_delete_permission = False
-                    for _, col_schema in table_schema.columns.items():
-                        if Operation.DELETE in col_schema.allowed_operations:
-                            has_delete_permission = True
-                            break
-                    if not has_delete_permission:
-                        raise ColumnAccessError(
-                            f"DELETE operation not allowed on table '{table_name}'"
-                        )
+                if (
+                    self.compiled.has_table(table_name)
+                    and table_name not in self.compiled.deletable_tables
+                ):
+                    raise ColumnAccessError(
+                        f"DELETE operation not allowed on table '{table_name}'"
+                    )
 
-        for column in parsed.find_all(exp.Column):
+        resolved_columns: List[Tuple[exp.Column, str, str]] = []
+        for column in facts.columns:
             table_name = None
             if column.table:
-                table_name = aliases.get(column.table.lower()) or column.table.lower()
+                table_alias = column.table.lower()
+                table_name = aliases.get(table_alias) or table_alias
             else:
-                table_name = self._get_default_table(parsed, column)
+                table_name = self._get_default_table(parsed, column, facts.tables)
 
-            if not table_name:
-                continue
+            if table_name:
+                resolved_columns.append((column, table_name, str(column.name).lower()))
 
-            column_name = str(column.name).lower()
-            column_rule = self.schema.get_column_schema(table_name, column_name)
+        # A read-only query that only uses columns the schema explicitly allows
+        # to be selected passes with a single subset test
+        if select_only:
+            referenced = {(table, name) for _, table, name in resolved_columns}
+            if referenced <= self.compiled.selectable_columns:
+                return
+
+        for column, table_name, column_name in resolved_columns:
+            column_rule = self.compiled.column_rule(table_name, column_name)
 
             # Check if column exists and has access
             if column_rule.access == Access.DENIED:
@@ -114,30 +156,39 @@ class ColumnValidator(BaseQueryValidator):
                     f"Access denied for column '{column_name}' in table '{table_name}'"
                 )
 
+            if select_only and column_rule.operations_mask & _SELECT_BIT:
+                continue
+
             # Get all operations being performed on this column
-            column_operations = self._get_column_operations(column, parsed)
+            column_operations = self._get_column_operations(column, column_name, facts)
 
-            # Check if all operations are allowed for this column
-            for operation in column_operations:
-                if operation not in column_rule.allowed_operations:
-                    raise ColumnAccessError(
-                        f"Operation {operation} not allowed for column '{column_name}' in table '{table_name}'. "
-                        f"Allowed operations: {', '.join(column_rule.allowed_operations)}"
-                    )
+            # Check if all operations are allowed for this column, as one
+            # bitwise test of the used operations against the allowed ones
+            denied_mask = (
+                operations_mask(column_operations) & ~column_rule.operations_mask
+            )
+            if denied_mask:
+                operation = OPERATIONS_BY_BIT[denied_mask & -denied_mask]
+                raise ColumnAccessError(
+                    f"Operation {operation} not allowed for column '{column_name}' in table '{table_name}'. "
+                    f"Allowed operations: {', '.join(column_rule.allowed_operations)}"
+                )
 
             # Check if column is being written to and only has READ access
-            col_id = f"{table_name}.{column_name}"
-            if col_id in write_columns and column_rule.access == Access.READ:
+            if (
+                table_name,
+                column_name,
+            ) in write_columns and column_rule.access == Access.READ:
                 raise ColumnAccessError(
                     f"Write access denied for column '{column_name}' in table '{table_name}'. "
                     f"Column only has read access."
                 )
 
     def _get_write_columns(
-        self, parsed: exp.Expression, aliases: Dict[str, str]
-    ) -> Set[str]:
-        """Get set of columns that are being written to."""
-        write_columns = set()
+        self, parsed: exp.Expression, facts: QueryFacts, aliases: Dict[str, str]
+    ) -> Set[Tuple[str, str]]:
+        """Get set of (table, column) names that are being written to."""
+        write_columns: Set[Tuple[str, str]] = set()
 
         def add_write_column(
             column: exp.Column, table_context: Optional[str] = None
@@ -145,18 +196,18 @@ class ColumnValidator(BaseQueryValidator):
             """Helper to add column to write set."""
             table_name = None
             if column.table:
-                table_name = aliases.get(column.table.lower()) or column.table.lower()
+                table_alias = column.table.lower()
+                table_name = aliases.get(table_alias) or table_alias
             elif table_context:
                 table_name = table_context
             else:
-                table_name = self._get_default_table(parsed, column)
+                table_name = self._get_default_table(parsed, column, facts.tables)
 
             if table_name:
-                col_id = f"{table_name}.{column.name.lower()}"
-                write_columns.add(col_id)
+                write_columns.add((table_name, column.name.lower()))
 
         # Handle UPDATE SET clause
-        for update in parsed.find_all(exp.Update):
+        for update in facts.updates:
             table_context = (
                 update.this.name if isinstance(update.this, exp.Table) else None
             )
@@ -166,7 +217,7 @@ class ColumnValidator(BaseQueryValidator):
                         add_write_column(expr.left, table_context)
 
         # Handle INSERT columns
-        for insert in parsed.find_all(exp.Insert):
+        for insert in facts.inserts:
             table_context = (
                 insert.this.name if isinstance(insert.this, exp.Table) else None
             )
@@ -176,7 +227,7 @@ class ColumnValidator(BaseQueryValidator):
                         add_write_column(col, table_context)
 
         # Handle DELETE - gets all columns from the target table used in the query
-        for delete in parsed.find_all(exp.Delete):
+        for delete in facts.deletes:
             table_context = (
                 delete.this.name if isinstance(delete.this, exp.Table) else None
             )
@@ -0,0 +1,128 @@
+from typing import Dict, List, Optional, Tuple, Type
+from sqlglot import exp
+from sqlglot.expressions import AggFunc
+from ..exceptions.errors import JoinViolationError, QueryComplexityError
+
+# Node types collected by QueryFacts, mapped to the attribute holding them.
+# Subclasses of these types are collected as well, like with find_all.
+_NODE_KINDS: Tuple[Tuple[Tuple[Type[exp.Expression], ...], str], ...] = (
+    ((exp.Table,), "tables"),
+    ((exp.Column,), "columns"),
+    ((exp.Join,), "joins"),
+    (tuple(AggFunc.__subclasses__()), "aggregations"),
+    ((exp.Select,), "selects"),
+    ((exp.Update,), "updates"),
+    ((exp.Insert,), "inserts"),
+    ((exp.Delete,), "deletes"),
+    ((exp.Union,), "unions"),
+)
+
+# Resolved kind per concrete node type, filled lazily as types are encountered
+_KIND_BY_TYPE: Dict[Type[exp.Expression], Optional[str]] = {}
+
+
+def _resolve_kind(node_type: Type[exp.Expression]) -> Optional[str]:
+    """Returns the QueryFacts attribute collecting nodes of the given type."""
+    for types, kind in _NODE_KINDS:
+        if issubclass(node_type, types):
+            return kind
+    return None
+
+
+class QueryFacts:
+    """
+    Nodes of interest in a parsed query, collected in a single walk of the AST.
+    Every list keeps the breadth-first order find_all would produce.
+
+    When max_joins is set, or allow_subqueries is False, the walk raises as
+    soon as the limit is crossed instead of collecting the rest of the query.
+    """
+
+    __slots__ = (
+        "parsed",
+        "tables",
+        "columns",
+        "joins",
+        "aggregations",
+        "selects",
+        "updates",
+        "inserts",
+        "deletes",
+        "unions",
+        "_table_aliases",
+    )
+
+    def __init__(
+        self,
+        parsed: exp.Expression,
+        max_joins: Optional[int] = None,
+        allow_subqueries: bool = True,
+    ):
+        self.parsed = parsed
+        self.tables: List[exp.Table] = []
+        self.columns: List[exp.Column] = []
+        self.joins: List[exp.Join] = []
+        self.aggregations: List[exp.Expression] = []
+        self.selects: List[exp.Select] = []
+        self.updates: List[exp.Update] = []
+        self.inserts: List[exp.Insert] = []
+        self.deletes: List[exp.Delete] = []
+        self.unions: List[exp.Union] = []
+        self._table_aliases: Optional[Dict[str, str]] = None
+
+        # Breadth-first walk over an explicit queue, in the order of
+        # Expression.walk but without a generator frame per node
+        queue: List[exp.Expression] = [parsed]
+        append = queue.append
+        expression = exp.Expression
+        for node in queue:
+            for value in node.args.values():
+                if type(value) is list:
+                    for item in value:
+                        if isinstance(item, expression):
+                            append(item)
+                elif isinstance(value, expression):
+                    append(value)
+
+            node_type = type(node)
+            try:
+                kind = _KIND_BY_TYPE[node_type]
+            except KeyError:
+                kind = _KIND_BY_TYPE[node_type] = _resolve_kind(node_type)
+            if kind is None:
+                continue
+
+            getattr(self, kind).append(node)
+            if kind == "joins" and max_joins and len(self.joins) > max_joins:
+                raise JoinViolationError(
+                    f"Number of joins ({len(self.joins)}) exceeds maximum allowed ({max_joins})"
+                )
+            if kind == "selects" and not allow_subqueries and _is_subquery(node):
+                raise QueryComplexityError(
+                    "Subqueries are not allowed in the current security configuration"
+                )
+
+    @property
+    def table_aliases(self) -> Dict[str, str]:
+        """
+        Lower-cased table name per lower-cased alias, built on first access and
+        shared by every validator. Callers must not modify it.
+        """
+        if self._table_aliases is None:
+            aliases = {}
+            for table in self.tables:
+                alias = table.alias
+                if alias:
+                    aliases[alias.lower()] = table.name.lower()
+            self._table_aliases = aliases
+        return self._table_aliases
+
+    @property
+    def subqueries(self) -> List[exp.Select]:
+        """SELECT expressions that are neither the root query nor part of a UNION."""
+        return [node for node in self.selects if _is_subquery(node)]
+
+
+def _is_subquery(node: exp.Expression) -> bool:
+    """Whether a SELECT is nested, rather than the root query or part of a UNION."""
+    return node.parent is not None and not isinstance(node.parent, exp.Union)
@@ -1,42 +1,61 @@
-from typing import List, Pattern, Set, Optional
+from typing import Dict, List, Pattern, Set, Optional, Tuple
 from ..exceptions.errors import SQLInjectionError
 from .base import BaseQueryValidator
+from .facts import QueryFacts
+from ..schema.compiled import CompiledSchema
 from ..schema.security_schema import SecuritySchema
 import re
 from sqlglot import exp
 
+# Common SQL injection patterns, matched case-insensitively
+INJECTION_PATTERNS: List[str] = [
+    # Comments
+    r"--",
+    r"/\*.*?\*/",
+    # UNION-based attacks
+    r"UNION\s+(?:ALL\s+)?SELECT",
+    # Command execution
+    r"(?:EXEC(?:UTE)?|xp_cmdshell|sp_executesql)\s*[\(\s]",
+    # Boolean-based injection patterns
+    r"\bOR\s+[\'\"0-9]\s*=\s*[\'\"0-9]",
+    r"\bAND\s+[\'\"0-9]\s*=\s*[\'\"0-9]",
+    # String concatenation
+    r"\|\|",
+    r"CONCAT\s*\(",
+    # Time-based injection patterns
+    r"SLEEP\s*\(",
+    r"WAITFOR\s+DELAY",
+    r"BENCHMARK\s*\(",
+    # System table access
+    r"information_schema",
+    r"sys\.",
+    # Dangerous functions
+    r"(?:LOAD_FILE|INTO\s+OUTFILE|INTO\s+DUMPFILE)",
+]
+
+
+def _compile_injection_patterns(
+    patterns: List[str],
+) -> Tuple[Pattern, Dict[str, str]]:
+    """
+    Compiles all patterns into a single alternation so a string is scanned once.
+    Returns the compiled regex and a mapping of group name to source pattern.
+    """
+    groups = {f"p{i}": pattern for i, pattern in enumerate(patterns)}
+    combined = "|".join(f"(?P<{name}>{pattern})" for name, pattern in groups.items())
+    return re.compile(combined, re.IGNORECASE | re.DOTALL), groups
 
-class SQLInjectionValidator(BaseQueryValidator):
-    def __init__(self, schema: Optional[SecuritySchema] = None):
-        super().__init__(schema)
-        # Common SQL injection patterns
-        self.patterns: List[Pattern] = [
-            # Comments
-            re.compile(r"--", re.IGNORECASE),
-            re.compile(r"/\*.*?\*/", re.IGNORECASE | re.DOTALL),
-            # UNION-based attacks
-            re.compile(r"UNION\s+(?:ALL\s+)?SELECT", re.IGNORECASE),
-            # Command execution
-            re.compile(
-                r"(?:EXEC(?:UTE)?|xp_cmdshell|sp_executesql)\s*[\(\s]", re.IGNORECASE
-            ),
-            # Boolean-based injection patterns
-            re.compile(r"\bOR\s+[\'\"0-9]\s*=\s*[\'\"0-9]", re.IGNORECASE),
-            re.compile(r"\bAND\s+[\'\"0-9]\s*=\s*[\'\"0-9]", re.IGNORECASE),
-            # String concatenation
-            re.compile(r"\|\|", re.IGNORECASE),
-            re.compile(r"CONCAT\s*\(", re.IGNORECASE),
-            # Time-based injection patterns
-            re.compile(r"SLEEP\s*\(", re.IGNORECASE),
-            re.compile(r"WAITFOR\s+DELAY", re.IGNORECASE),
-            re.compile(r"BENCHMARK\s*\(", re.IGNORECASE),
-            # System table access
-            re.compile(r"information_schema", re.IGNORECASE),
-            re.compile(r"sys\.", re.IGNORECASE),
-            # Dangerous functions
-            re.compile(r"(?:LOAD_FILE|INTO\s+OUTFILE|INTO\s+DUMPFILE)", re.IGNORECASE),
-        ]
 
+_INJECTION_RE, _INJECTION_GROUPS = _compile_injection_patterns(INJECTION_PATTERNS)
+
+
+class SQLInjectionValidator(BaseQueryValidator):
+    def __init__(
+        self,
+        schema: Optional[SecuritySchema] = None,
+        compiled: Optional[CompiledSchema] = None,
+    ):
+        super().__init__(schema, compiled)
         # Common SQL special characters and sequences that might indicate injection
         self.suspicious_tokens: Set[str] = {
             "'='",
@@ -52,12 +71,17 @@ class SQLInjectionValidator(BaseQueryValidator):
             "'--",
         }
 
+        self._suspicious_tokens_lower = tuple(
+            token.lower() for token in self.suspicious_tokens
+        )
+
+    def is_needed(self) -> bool:
+        return self.schema.sql_injection_protection
+
     def _check_suspicious_tokens(self, query: str) -> bool:
         """Check for suspicious token combinations that might indicate SQL injection."""
         normalized_query = query.lower()
-        return any(
-            token.lower() in normalized_query for token in self.suspicious_tokens
-        )
+        return any(token in normalized_query for token in self._suspicious_tokens_lower)
 
     def _check_quote_balance(self, query: str) -> bool:
         """Check if quotes are properly balanced in the query."""
@@ -65,27 +89,36 @@ class SQLInjectionValidator(BaseQueryValidator):
         double_quotes = query.count('"') % 2
         return single_quotes == 0 and double_quotes == 0
 
-    def _check_expression_recursively(self, expr: exp.Expression) -> None:
-        """
-        Recursively check an expression and its children for SQL injection patterns.
-        """
-        # Convert the expression to a string for pattern matching
-        expr_str = str(expr)
-
-        # Check for pattern matches
-        for pattern in self.patterns:
-            match = pattern.search(expr_str)
-            if match:
-                raise SQLInjectionError(
-                    f"Potential SQL injection detected - matches pattern: {pattern.pattern}"
-                )
+    def _check_sql(self, sql: str) -> None:
+        """Check generated SQL for injection patterns and suspicious tokens."""
+        # Check for pattern matches in a single pass over the string
+        match = _INJECTION_RE.search(sql)
+        if match:
+            raise SQLInjectionError(
+                "Potential SQL injection detected - matches pattern: "
+                f"{_INJECTION_GROUPS[match.lastgroup]}"  # type: ignore[index]
+            )
 
         # Check for suspicious tokens
-        if self._check_suspicious_tokens(expr_str):
+        if self._check_suspicious_tokens(sql):
             raise SQLInjectionError(
                 "Potential SQL injection detected - contains suspicious token combination"
             )
 
+    def _check_expression_recursively(
+        self,
+        expr: exp.Expression,
+        sql_checked: bool = False,
+        facts: Optional[QueryFacts] = None,
+    ) -> None:
+        """
+        Recursively check an expression and its children for SQL injection patterns.
+        sql_checked skips the text checks when an ancestor's SQL was already scanned.
+        facts, if collected from expr, provides its UNION nodes without a new walk.
+        """
+        if not sql_checked:
+            self._check_sql(str(expr))
+
         # Special checks for different expression types
         if isinstance(expr, exp.Literal) and isinstance(expr.this, str):
             # Check string literals more thoroughly
@@ -96,9 +129,14 @@ class SQLInjectionValidator(BaseQueryValidator):
 
         elif isinstance(expr, exp.Select):
             # Additional checks specific to SELECT statements
-            if any(isinstance(e, exp.Union) for e in expr.find_all(exp.Union)):
+            unions = (
+                facts.unions
+                if facts is not None and facts.parsed is expr
+                else list(expr.find_all(exp.Union))
+            )
+            if unions:
                 # Verify UNION usage
-                union_expr = next(expr.find_all(exp.Union))
+                union_expr = unions[0]
                 if not (
                     isinstance(union_expr.left, exp.Select)
                     and isinstance(union_expr.right, exp.Select)
@@ -107,16 +145,20 @@ class SQLInjectionValidator(BaseQueryValidator):
                         "Potential SQL injection detected - suspicious UNION usage"
                     )
 
-        # Recursively check all child expressions
+        # Recursively check all child expressions. Their SQL is part of the SQL
+        # scanned above, so only the node-specific checks remain to be done.
         for child in expr.expressions:
-            self._check_expression_recursively(child)
+            self._check_expression_recursively(child, sql_checked=True)
 
-    def validate(self, parsed: exp.Expression) -> None:
+    def validate(
+        self, parsed: exp.Expression, facts: Optional[QueryFacts] = None
+    ) -> None:
         """
         Validates the given SQL query for potential SQL injection attempts.
 
         Args:
             parsed: The parsed SQL expression to validate
+            facts: Nodes collected from parsed, to reuse instead of walking again
 
         Raises:
             SQLInjectionError: If potential SQL injection is detected
@@ -126,7 +168,7 @@ class SQLInjectionValidator(BaseQueryValidator):
             raise ValueError("Expression must not be empty")
 
         try:
-            self._check_expression_recursively(parsed)
+            self._check_expression_recursively(parsed, facts=facts)
         except SQLInjectionError as e:
             raise e
         except Exception as e:
@@ -1,15 +1,19 @@
 from typing import Dict, Tuple, Optional
 from sqlglot import exp
 from .base import BaseQueryValidator
+from .facts import QueryFacts
 from ..schema.sql.enums import JoinType
 from ..exceptions.errors import JoinViolationError
 
 
 class JoinValidator(BaseQueryValidator):
-    def validate(self, parsed: exp.Expression) -> None:
+    def validate(
+        self, parsed: exp.Expression, facts: Optional[QueryFacts] = None
+    ) -> None:
         """Validates all JOIN operations in the query."""
-        aliases = self._collect_table_aliases(parsed)
-        joins = list(parsed.find_all(exp.Join))
+        facts = facts or QueryFacts(parsed)
+        aliases = self._collect_table_aliases(facts)
+        joins = facts.joins
 
         if self.schema.max_joins and len(joins) > self.schema.max_joins:
             raise JoinViolationError(
@@ -26,17 +30,18 @@ class JoinValidator(BaseQueryValidator):
             return
 
         # Resolve aliases to actual table names
-        left_table = aliases.get(left_table.lower(), left_table.lower())
-        right_table = aliases.get(right_table.lower(), right_table.lower())
+        left_table = left_table.lower()
+        right_table = right_table.lower()
+        left_table = aliases.get(left_table, left_table)
+        right_table = aliases.get(right_table, right_table)
 
         join_type = self._get_join_type(join)
+        if self._is_join_allowed(left_table, right_table, join_type):
+            return
 
-        # Get schema for both tables
-        left_schema = self.schema.get_table_schema(left_table)
-        right_schema = self.schema.get_table_schema(right_table)
-
-        left_join_rule = left_schema.get_table_allowed_joins(right_table)
-        right_join_rule = right_schema.get_table_allowed_joins(left_table)
+        # Disallowed joins look up both rules to explain the violation
+        left_join_rule = self.compiled.join_rule(left_table, right_table)
+        right_join_rule = self.compiled.join_rule(right_table, left_table)
 
         # For FULL JOIN, check both directions
         if join_type == JoinType.FULL:
@@ -86,19 +91,34 @@ class JoinValidator(BaseQueryValidator):
                     f"Allowed types: {left_join_rule}"
                 )
 
-    def _collect_table_aliases(self, parsed: exp.Expression) -> Dict[str, str]:
-        """Collects all table aliases in the query."""
-        aliases = {}
-
-        for table in parsed.find_all(exp.Table):
-            if table.alias:
-                aliases[str(table.alias).lower()] = str(table.name).lower()
+    def _is_join_allowed(
+        self, left_table: str, right_table: str, join_type: JoinType
+    ) -> bool:
+        """Whether the schema allows a join, by the same rules as the checks below."""
+        allows_join = self.compiled.allows_join
+        if join_type == JoinType.FULL:
+            return allows_join(left_table, right_table, JoinType.FULL) and allows_join(
+                right_table, left_table, JoinType.FULL
+            )
+        if join_type == JoinType.RIGHT:
+            return allows_join(right_table, left_table, JoinType.LEFT)
+        if join_type == JoinType.CROSS:
+            return allows_join(left_table, right_table, JoinType.CROSS) or allows_join(
+                right_table, left_table, JoinType.CROSS
+            )
+        return allows_join(left_table, right_table, join_type)
 
-        for join in parsed.find_all(exp.Join):
+    def _collect_table_aliases(self, facts: QueryFacts) -> Dict[str, str]:
+        """Collects all table aliases in the query."""
+        # Joined tables take precedence when an alias is reused in the query
+        overrides = {}
+        for join in facts.joins:
             if isinstance(join.this, exp.Table) and join.this.alias:
-                aliases[str(join.this.alias).lower()] = str(join.this.name).lower()
+                overrides[str(join.this.alias).lower()] = str(join.this.name).lower()
 
-        return aliases
+        if not overrides:
+            return facts.table_aliases
+        return {**facts.table_aliases, **overrides}
 
     def _get_join_tables(self, join: exp.Join) -> Tuple[Optional[str], Optional[str]]:
         """Gets the two tables involved in a join."""
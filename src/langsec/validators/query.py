@@ -1,17 +1,68 @@
-from typing import Optional
-from sqlglot import parse_one
+import re
+from typing import Callable, List, NamedTuple, Optional, Pattern
 
+from ..parser import parse
+from ..schema.compiled import CompiledSchema
 from ..schema.security_schema import SecuritySchema
 from ..config import LangSecConfig
 from ..exceptions.errors import (
     QueryComplexityError,
+    TableAccessError,
 )
+from .base import BaseQueryValidator
 from .table import TableValidator
 from .column import ColumnValidator
 from .join import JoinValidator
 from .aggregation import AggregationValidator
 from .subquery import SubqueryValidator
 from .injection import SQLInjectionValidator
+from .facts import QueryFacts
+
+# String literals, quoted identifiers and comments, which the patterns below
+# consume whole so that their contents never match. An unterminated one runs
+# to the end of the query, so the scan never restarts from inside it; this
+# keeps the prefilters linear in the query length.
+_SKIPPED_SQL = r"""
+    '(?:[^']|'')*(?:'|\Z)
+    | "(?:[^"]|"")*(?:"|\Z)
+    | `[^`]*(?:`|\Z)
+    | --[^\n]*
+    | /\*.*?(?:\*/|\Z)
+"""
+
+# Lexes just enough SQL to find the tables named right after FROM or JOIN.
+# Parentheses are reported so only references outside any parentheses count.
+# Quoted names, function calls and IS DISTINCT FROM never match as tables.
+_TABLE_REFERENCE_RE = re.compile(
+    _SKIPPED_SQL
+    + r"""
+    | (?P<open>\()
+    | (?P<close>\))
+    | (?P<distinct>\bDISTINCT\s+)?
+      \b(?:FROM|JOIN)\s+
+      (?!(?:LATERAL|ONLY)\b)
+      (?P<table>[A-Za-z_][\w$]*(?:\.[A-Za-z_][\w$]*)*)\b
+      (?!\s*[.(])
+    """,
+    re.IGNORECASE | re.DOTALL | re.VERBOSE,
+)
+
+# A parenthesized SELECT, which always parses to a nested query
+_SUBQUERY_RE = re.compile(
+    _SKIPPED_SQL + r"| (?P<subquery>\(\s*SELECT\b)",
+    re.IGNORECASE | re.DOTALL | re.VERBOSE,
+)
+
+
+class QueryContext(NamedTuple):
+    """Derived forms of a query string, computed once and shared by prechecks."""
+
+    raw: str
+    upper: str
+
+    @classmethod
+    def from_query(cls, query: str) -> "QueryContext":
+        return cls(query, query.upper())
 
 
 class QueryValidator:
@@ -23,47 +74,150 @@ class QueryValidator:
         self.schema = schema or SecuritySchema()
         self.config = config or LangSecConfig()
 
-        # Initialize all validators
-        self.table_validator = TableValidator(schema)
-        self.column_validator = ColumnValidator(schema)
-        self.join_validator = JoinValidator(schema)
-        self.aggregation_validator = AggregationValidator(schema)
-        self.subqueries_validator = SubqueryValidator(schema)
+        # Initialize all validators on one set of flattened schema lookups
+        self.compiled = CompiledSchema(self.schema)
+        self._prechecks = self._compile_prechecks()
 
-        if self.schema.sql_injection_protection:
-            self.sql_injection_validator = SQLInjectionValidator()
+        self.table_validator = TableValidator(self.schema, self.compiled)
+        self.column_validator = ColumnValidator(self.schema, self.compiled)
+        self.join_validator = JoinValidator(self.schema, self.compiled)
+        self.aggregation_validator = AggregationValidator(self.schema, self.compiled)
+        self.subqueries_validator = SubqueryValidator(self.schema, self.compiled)
+        self.sql_injection_validator = SQLInjectionValidator(self.schema, self.compiled)
+
+        # Only validators with rules enabled by the schema run per query, in a
+        # fixed order: the column ACL, which rejects most denied queries,
+        # runs before the join and aggregation rules, and the injection scan
+        # over the raw text runs last
+        self.validators: List[BaseQueryValidator] = [
+            validator
+            for validator in (
+                self.table_validator,
+                self.column_validator,
+                self.join_validator,
+                self.aggregation_validator,
+                self.subqueries_validator,
+                self.sql_injection_validator,
+            )
+            if validator.is_needed()
+        ]
+        self._validate = self._compile_validate()
 
     def validate(self, query: str) -> bool:
         """Validates a query against all configured rules."""
-        self._validate_query_length(query)
-        self._validate_forbidden_keywords(query)
+        self._validate(query)
+        return True
 
-        parsed = parse_one(query)
+    def _compile_validate(self) -> Callable[[str], None]:
+        """
+        Specializes the validation pipeline to the schema. The prechecks,
+        validators and walk limits are bound as closure constants, so a call
+        does no attribute lookups on the validator or the schema.
+        """
+        prechecks = tuple(self._prechecks)
+        validators = tuple(validator.validate for validator in self.validators)
+        max_joins = self.schema.max_joins
+        allow_subqueries = self.schema.allow_subqueries
+        from_query = QueryContext.from_query
 
-        # Run all validators
-        self.table_validator.validate(parsed)
-        self.join_validator.validate(parsed)
-        self.column_validator.validate(parsed)
-        self.aggregation_validator.validate(parsed)
-        self.subqueries_validator.validate(parsed)
+        def validate(query: str) -> None:
+            if prechecks:
+                context = from_query(query)
+                for precheck in prechecks:
+                    precheck(context)
 
-        if self.schema.sql_injection_protection:
-            self.sql_injection_validator.validate(parsed)
+            parsed = parse(query)
+            facts = QueryFacts(parsed, max_joins, allow_subqueries)
+            for validate_parsed in validators:
+                validate_parsed(parsed, facts)
 
-        return True
+        return validate
 
-    def _validate_query_length(self, query: str) -> None:
-        if self.schema.max_query_length and len(query) > self.schema.max_query_length:
-            raise QueryComplexityError(
-                f"Query length exceeds maximum allowed "
-                f"({len(query)} > {self.schema.max_query_length})"
-            )
+    def _compile_prechecks(self) -> List[Callable[[QueryContext], None]]:
+        """
+        Specializes the string-level checks to the schema. Limits are bound as
+        closure constants, and checks the schema does not enable are left out.
+        """
+        prechecks: List[Callable[[QueryContext], None]] = []
+
+        max_query_length = self.schema.max_query_length
+        if max_query_length:
+
+            def validate_query_length(context: QueryContext) -> None:
+                if len(context.raw) > max_query_length:
+                    raise QueryComplexityError(
+                        f"Query length exceeds maximum allowed "
+                        f"({len(context.raw)} > {max_query_length})"
+                    )
+
+            prechecks.append(validate_query_length)
+
+        forbidden_keywords_re = self._compile_forbidden_keywords()
+        if forbidden_keywords_re is not None:
+            search = forbidden_keywords_re.search
+            # The regex matches upper-cased keywords literally, so the match is
+            # the dict key
+            messages = {
+                keyword.upper(): f"Forbidden keyword found: {keyword.upper()}"
+                for keyword in self.schema.forbidden_keywords
+            }
+
+            def validate_forbidden_keywords(context: QueryContext) -> None:
+                match = search(context.upper)
+                if match:
+                    raise QueryComplexityError(messages[match.group(0)])
+
+            prechecks.append(validate_forbidden_keywords)
+
+        if self.compiled.table_names:
+            table_names = self.compiled.table_names
+
+            def reject_unknown_tables(context: QueryContext) -> None:
+                depth = 0
+                for match in _TABLE_REFERENCE_RE.finditer(context.raw):
+                    if match.group("open"):
+                        depth += 1
+                    elif match.group("close"):
+                        depth -= 1
+                    elif (
+                        depth == 0
+                        and match.group("table")
+                        and not match.group("distinct")
+                    ):
+                        table_name = match.group("table").rsplit(".", 1)[-1].lower()
+                        if table_name not in table_names:
+                            raise TableAccessError(
+                                f"Access to table '{table_name}' is not allowed"
+                            )
+
+            prechecks.append(reject_unknown_tables)
+
+        if not self.schema.allow_subqueries:
+
+            def reject_subqueries(context: QueryContext) -> None:
+                for match in _SUBQUERY_RE.finditer(context.raw):
+                    if match.group("subquery"):
+                        raise QueryComplexityError(
+                            "Subqueries are not allowed in the current security configuration"
+                        )
+
+            prechecks.append(reject_subqueries)
+
+        return prechecks
 
-    def _validate_forbidden_keywords(self, query: str) -> None:
+    def _compile_forbidden_keywords(self) -> Optional[Pattern]:
+        """
+        Compiles the forbidden keywords into one alternation, longest first, so
+        the upper-cased query is scanned once instead of once per keyword.
+        """
         if not self.schema.forbidden_keywords:
-            return
+            return None
 
-        query_upper = query.upper()
-        for keyword in self.schema.forbidden_keywords:
-            if keyword.upper() in query_upper:
-                raise QueryComplexityError(f"Forbidden keyword found: {keyword}")
+        # Keywords added to the set in place skip the field validator, so they
+        # are upper-cased here as well
+        keywords = sorted(
+            {keyword.upper() for keyword in self.schema.forbidden_keywords},
+            key=len,
+            reverse=True,
+        )
+        return re.compile("|".join(re.escape(keyword) for keyword in keywords))
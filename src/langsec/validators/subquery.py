@@ -1,31 +1,32 @@
+from typing import Optional
 from sqlglot import exp
 from .base import BaseQueryValidator
+from .facts import QueryFacts
 from ..exceptions.errors import QueryComplexityError
 
 
 class SubqueryValidator(BaseQueryValidator):
     """Validator for checking subquery permissions and constraints."""
 
-    def validate(self, parsed: exp.Expression) -> None:
+    def is_needed(self) -> bool:
+        return not self.schema.allow_subqueries
+
+    def validate(
+        self, parsed: exp.Expression, facts: Optional[QueryFacts] = None
+    ) -> None:
         """
         Validates that subqueries are allowed if present in the query.
 
         Args:
             parsed: The parsed SQL expression
+            facts: Nodes collected from the parsed expression
 
         Raises:
             QueryComplexityError: If subqueries are found when not allowed
         """
         if not self.schema.allow_subqueries:
-            # Find all SELECT expressions that are not the root query
-            # and not part of a UNION
-            subqueries = [
-                node
-                for node in parsed.find_all(exp.Select)
-                if (node.parent is not None and not isinstance(node.parent, exp.Union))
-            ]
-
-            if subqueries:
+            facts = facts or QueryFacts(parsed)
+            if facts.subqueries:
                 raise QueryComplexityError(
                     "Subqueries are not allowed in the current security configuration"
                 )
@@ -1,5 +1,7 @@
+from typing import Optional
 from sqlglot import exp
 from .base import BaseQueryValidator
+from .facts import QueryFacts
 from ..exceptions.errors import TableAccessError
 
 
@@ -8,12 +10,17 @@ class TableValidator(BaseQueryValidator):
         """Get the actual table name, ignoring alias."""
         return table.name.lower()
 
-    def validate(self, parsed: exp.Expression) -> None:
-        if not self.schema.tables:
+    def is_needed(self) -> bool:
+        return bool(self.schema.tables)
+
+    def validate(
+        self, parsed: exp.Expression, facts: Optional[QueryFacts] = None
+    ) -> None:
+        if not self.compiled.table_names:
             return
 
-        for table in parsed.find_all(exp.Table):
+        facts = facts or QueryFacts(parsed)
+        for table in facts.tables:
             table_name = self._get_actual_table_name(table)
-            schema_tables_lower = {t.lower() for t in self.schema.tables}
-            if table_name not in schema_tables_lower:
+            if not self.compiled.has_table(table_name):
                 raise TableAccessError(f"Access to table '{table_name}' is not allowed")
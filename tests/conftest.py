@@ -11,9 +11,8 @@ from langsec.schema.sql.enums import (
     Access
 )
 
-@pytest.fixture
-def security_schema_allow_all():
-    """Provides a security schema that allows most operations."""
+def _allow_all_schema_kwargs():
+    """Builds the keyword arguments shared by the allow-all schemas."""
     default_table_schema = TableSchema(
         default_allowed_join={
             JoinType.CROSS, 
@@ -28,17 +27,22 @@ def security_schema_allow_all():
         allowed_aggregations={AggregationType.SUM, AggregationType.COUNT}
     )
     
-    return SecuritySchema(
+    return dict(
         default_table_security_schema=default_table_schema,
         default_column_security_schema=default_column_schema
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def security_schema_allow_all():
+    """Provides a security schema that allows most operations."""
+    return SecuritySchema(**_allow_all_schema_kwargs())
+
+@pytest.fixture(scope="session")
 def security_guard_allow_all(security_schema_allow_all):
     """Provides a security guard with default table and column security schemas."""
     return SQLSecurityGuard(security_schema_allow_all)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def security_guard_deny_AVG():
     """Provides a security guard that denies AVG aggregations."""
     default_table_schema = TableSchema(
@@ -58,7 +62,7 @@ def security_guard_deny_AVG():
     
     return SQLSecurityGuard(security_schema)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def security_guard_deny_all():
     """Provides a security guard that denies most operations."""
     default_table_schema = TableSchema(
@@ -78,7 +82,7 @@ def security_guard_deny_all():
     
     return SQLSecurityGuard(security_schema)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def security_guard_require_where_clause_all():
     """Provides a security guard that requires WHERE clauses."""
     default_table_schema = TableSchema(
@@ -98,28 +102,27 @@ def security_guard_require_where_clause_all():
     
     return SQLSecurityGuard(security_schema)
 
-@pytest.fixture
-def basic_schema():
-    """Provides a basic security schema for testing."""
-    return SecuritySchema(
+def _basic_schema_kwargs():
+    """Builds the keyword arguments shared by the basic schemas."""
+    return dict(
         tables={
-            "users": TableSchema(
+            "users": TableSchema.unchecked(
                 columns={
-                    "id": ColumnSchema(access=Access.READ),
-                    "username": ColumnSchema(access=Access.READ),
-                    "created_at": ColumnSchema(access=Access.READ),
-                    "column_1": ColumnSchema(access=Access.READ),
+                    "id": ColumnSchema.unchecked(access=Access.READ),
+                    "username": ColumnSchema.unchecked(access=Access.READ),
+                    "created_at": ColumnSchema.unchecked(access=Access.READ),
+                    "column_1": ColumnSchema.unchecked(access=Access.READ),
                 },
                 allowed_joins={
                     "orders": {JoinType.INNER, JoinType.LEFT}
                 },
                 default_allowed_join=None
             ),
-            "orders": TableSchema(
+            "orders": TableSchema.unchecked(
                 columns={
-                    "id": ColumnSchema(access=Access.READ),
-                    "user_id": ColumnSchema(access=Access.READ),
-                    "amount": ColumnSchema(
+                    "id": ColumnSchema.unchecked(access=Access.READ),
+                    "user_id": ColumnSchema.unchecked(access=Access.READ),
+                    "amount": ColumnSchema.unchecked(
                         access=Access.READ,
                         allowed_aggregations={AggregationType.SUM, AggregationType.AVG},
                     ),
@@ -134,17 +137,22 @@ def basic_schema():
         max_query_length=500,
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def basic_schema():
+    """Provides a basic security schema for testing."""
+    return SecuritySchema(**_basic_schema_kwargs())
+
+@pytest.fixture(scope="session")
 def complex_schema():
     """Provides a complex security schema for testing."""
     return SecuritySchema(
         tables={
-            "users": TableSchema(
+            "users": TableSchema.unchecked(
                 columns={
-                    "id": ColumnSchema(access=Access.READ),
-                    "username": ColumnSchema(access=Access.READ),
-                    "created_at": ColumnSchema(access=Access.READ),
-                    "order_frequency": ColumnSchema(access=Access.READ),
+                    "id": ColumnSchema.unchecked(access=Access.READ),
+                    "username": ColumnSchema.unchecked(access=Access.READ),
+                    "created_at": ColumnSchema.unchecked(access=Access.READ),
+                    "order_frequency": ColumnSchema.unchecked(access=Access.READ),
                 },
                 allowed_joins={
                     "orders": {JoinType.INNER, JoinType.LEFT},
@@ -152,11 +160,11 @@ def complex_schema():
                 },
                 default_allowed_join=None
             ),
-            "orders": TableSchema(
+            "orders": TableSchema.unchecked(
                 columns={
-                    "id": ColumnSchema(access=Access.READ),
-                    "user_id": ColumnSchema(access=Access.READ),
-                    "amount": ColumnSchema(
+                    "id": ColumnSchema.unchecked(access=Access.READ),
+                    "user_id": ColumnSchema.unchecked(access=Access.READ),
+                    "amount": ColumnSchema.unchecked(
                         access=Access.READ,
                         allowed_aggregations={
                             AggregationType.MAX,
@@ -165,9 +173,9 @@ def complex_schema():
                             AggregationType.COUNT,
                         },
                     ),
-                    "product_id": ColumnSchema(access=Access.READ),
-                    "total_spent": ColumnSchema(access=Access.READ),
-                    "order_count": ColumnSchema(access=Access.READ),
+                    "product_id": ColumnSchema.unchecked(access=Access.READ),
+                    "total_spent": ColumnSchema.unchecked(access=Access.READ),
+                    "order_count": ColumnSchema.unchecked(access=Access.READ),
                 },
                 allowed_joins={
                     "users": {JoinType.INNER, JoinType.LEFT},
@@ -175,11 +183,11 @@ def complex_schema():
                 },
                 default_allowed_join=None
             ),
-            "products": TableSchema(
+            "products": TableSchema.unchecked(
                 columns={
-                    "id": ColumnSchema(access=Access.READ),
-                    "name": ColumnSchema(access=Access.READ),
-                    "price": ColumnSchema(
+                    "id": ColumnSchema.unchecked(access=Access.READ),
+                    "name": ColumnSchema.unchecked(access=Access.READ),
+                    "price": ColumnSchema.unchecked(
                         access=Access.READ,
                         allowed_aggregations={
                             AggregationType.AVG,
@@ -187,14 +195,14 @@ def complex_schema():
                             AggregationType.MAX,
                         },
                     ),
-                    "category": ColumnSchema(
+                    "category": ColumnSchema.unchecked(
                         access=Access.READ,
                         allowed_aggregations={AggregationType.COUNT},
                     ),
-                    "product_count": ColumnSchema(access=Access.READ),
-                    "avg_price": ColumnSchema(access=Access.READ),
-                    "total_sales": ColumnSchema(access=Access.READ),
-                    "max_product_price": ColumnSchema(access=Access.READ),
+                    "product_count": ColumnSchema.unchecked(access=Access.READ),
+                    "avg_price": ColumnSchema.unchecked(access=Access.READ),
+                    "total_sales": ColumnSchema.unchecked(access=Access.READ),
+                    "max_product_price": ColumnSchema.unchecked(access=Access.READ),
                 },
                 allowed_joins={
                     "orders": {JoinType.INNER, JoinType.LEFT}
@@ -217,37 +225,40 @@ def complex_schema():
         },
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def security_guard(basic_schema):
     """Provides a configured SQLSecurityGuard instance."""
     return SQLSecurityGuard(schema=basic_schema)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_security_guard(complex_schema):
     """Provides a SQLSecurityGuard instance with complex configuration."""
     return SQLSecurityGuard(schema=complex_schema)
 
-@pytest.fixture
-def security_guard_no_subqueries(basic_schema):
+@pytest.fixture(scope="session")
+def security_guard_no_subqueries():
     """Create a security guard with subqueries disabled."""
-    basic_schema.allow_subqueries = False
-    return SQLSecurityGuard(schema=basic_schema)
+    schema = SecuritySchema(**_basic_schema_kwargs(), allow_subqueries=False)
+    return SQLSecurityGuard(schema=schema)
 
-@pytest.fixture
-def security_deny_only_email_column(security_schema_allow_all: SecuritySchema):
+@pytest.fixture(scope="session")
+def security_deny_only_email_column():
     """Creates a security guard that denies access only to the email column."""
-    security_schema_allow_all.tables = {
-        "users": TableSchema(
-            columns={
-                "email": ColumnSchema(access=Access.DENIED),
-            },
-            default_allowed_join=None
-        )
-    }
+    schema = SecuritySchema(
+        **_allow_all_schema_kwargs(),
+        tables={
+            "users": TableSchema(
+                columns={
+                    "email": ColumnSchema(access=Access.DENIED),
+                },
+                default_allowed_join=None
+            )
+        },
+    )
 
-    return SQLSecurityGuard(security_schema_allow_all)
+    return SQLSecurityGuard(schema)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mixed_access_schema():
     """
     Provides a security schema with mixed read/write access:
@@ -305,7 +316,7 @@ def mixed_access_schema():
         forbidden_keywords=set()
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mixed_access_guard(mixed_access_schema):
     """Provides a security guard with mixed read/write access configuration."""
     return SQLSecurityGuard(mixed_access_schema)
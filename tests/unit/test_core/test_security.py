@@ -0,0 +1,192 @@
+import pytest
+from langsec import SQLSecurityGuard, LangSecConfig, SecuritySchema
+from langsec.exceptions.errors import (
+    ColumnAccessError,
+    QueryComplexityError,
+    TableAccessError,
+)
+from langsec.schema.security_schema import ColumnSchema, TableSchema
+from langsec.schema.sql.enums import Access, Operation
+
+
+class TestValidationCache:
+    def test_repeated_valid_query_is_cached(self, basic_schema):
+        """Test that a valid query is only validated once."""
+        guard = SQLSecurityGuard(schema=basic_schema)
+        query = "SELECT id, username FROM users"
+        assert guard.validate_query(query)
+        assert guard.validate_query(query)
+        assert len(guard._cache) == 1
+
+    def test_repeated_violation_is_reraised(self, basic_schema):
+        """Test that cached violations raise the same error on every call."""
+        guard = SQLSecurityGuard(schema=basic_schema)
+        query = "SELECT email FROM users"
+        for _ in range(2):
+            with pytest.raises(ColumnAccessError, match="email"):
+                guard.validate_query(query)
+        assert len(guard._cache) == 1
+
+    def test_schema_assignment_invalidates_cache(self):
+        """Test that assigning a schema field drops cached outcomes."""
+        schema = SecuritySchema(
+            default_column_security_schema=ColumnSchema(access=Access.READ)
+        )
+        guard = SQLSecurityGuard(schema=schema)
+        query = "SELECT id FROM users WHERE id IN (SELECT id FROM users)"
+        assert guard.validate_query(query)
+
+        schema.allow_subqueries = False
+        with pytest.raises(QueryComplexityError):
+            guard.validate_query(query)
+
+    def test_clear_cache_picks_up_tightened_column(self):
+        """Test that tightening a column in place applies after clear_cache."""
+        schema = SecuritySchema(
+            tables={
+                "users": TableSchema(
+                    columns={"email": ColumnSchema(access=Access.READ)}
+                )
+            }
+        )
+        guard = SQLSecurityGuard(schema=schema)
+        query = "SELECT email FROM users"
+        assert guard.validate_query(query)
+
+        schema.tables["users"].columns["email"].access = Access.DENIED
+        guard.clear_cache()
+        with pytest.raises(ColumnAccessError):
+            guard.validate_query(query)
+
+    def test_operations_removed_in_place_are_enforced(self):
+        """Test that an operation removed from a column in place is denied."""
+        schema = SecuritySchema(
+            tables={
+                "users": TableSchema(
+                    columns={"email": ColumnSchema(access=Access.READ)}
+                )
+            }
+        )
+        schema.tables["users"].columns["email"].allowed_operations.discard(
+            Operation.SELECT
+        )
+        with pytest.raises(ColumnAccessError):
+            SQLSecurityGuard(schema=schema).validate_query("SELECT email FROM users")
+
+    def test_clear_cache_picks_up_operation_removed_in_place(self):
+        """Test that removing an operation in place applies after clear_cache."""
+        schema = SecuritySchema(
+            tables={
+                "users": TableSchema(
+                    columns={"email": ColumnSchema(access=Access.READ)}
+                )
+            }
+        )
+        guard = SQLSecurityGuard(schema=schema)
+        query = "SELECT email FROM users"
+        assert guard.validate_query(query)
+
+        schema.tables["users"].columns["email"].allowed_operations.discard(
+            Operation.SELECT
+        )
+        guard.clear_cache()
+        with pytest.raises(ColumnAccessError):
+            guard.validate_query(query)
+
+    def test_clear_cache_picks_up_operation_added_in_place(self):
+        """Test that adding an operation in place applies after clear_cache."""
+        schema = SecuritySchema(
+            tables={
+                "users": TableSchema(
+                    columns={"email": ColumnSchema(access=Access.WRITE)}
+                )
+            },
+            forbidden_keywords=set(),
+        )
+        guard = SQLSecurityGuard(schema=schema)
+        query = "UPDATE users SET email = 'a@b.c'"
+        with pytest.raises(ColumnAccessError):
+            guard.validate_query(query)
+
+        schema.tables["users"].columns["email"].allowed_operations.add(
+            Operation.UPDATE
+        )
+        guard.clear_cache()
+        assert guard.validate_query(query)
+
+    def test_clear_cache_drops_outcomes(self, basic_schema):
+        """Test that clear_cache empties the outcome cache."""
+        guard = SQLSecurityGuard(schema=basic_schema)
+        assert guard.validate_query("SELECT id FROM users")
+        guard.clear_cache()
+        assert len(guard._cache) == 0
+
+    def test_clear_cache_picks_up_table_added_in_place(self):
+        """Test that a table added to the schema in place applies after clear_cache."""
+        schema = SecuritySchema(
+            tables={
+                "users": TableSchema(columns={"id": ColumnSchema(access=Access.READ)})
+            }
+        )
+        guard = SQLSecurityGuard(schema=schema)
+        query = "SELECT id FROM orders"
+        with pytest.raises(TableAccessError):
+            guard.validate_query(query)
+
+        schema.tables["orders"] = TableSchema(
+            columns={"id": ColumnSchema(access=Access.READ)}
+        )
+        guard.clear_cache()
+        assert guard.validate_query(query)
+
+    def test_cache_disabled(self, basic_schema):
+        """Test that a cache size of zero disables caching."""
+        guard = SQLSecurityGuard(
+            schema=basic_schema, config=LangSecConfig(cache_size=0)
+        )
+        assert guard.validate_query("SELECT id FROM users")
+        assert len(guard._cache) == 0
+
+
+class TestValidateMany:
+    def test_results_in_input_order(self, security_guard):
+        """Test that results and exceptions are returned in input order."""
+        results = security_guard.validate_many(
+            [
+                "SELECT id FROM users",
+                "SELECT email FROM users",
+                "SELECT amount FROM orders",
+            ],
+            workers=2,
+        )
+        assert results[0] is True
+        assert isinstance(results[1], ColumnAccessError)
+        assert results[2] is True
+
+    def test_repeated_queries_share_result(self, security_guard):
+        """Test that a query repeated in the batch is validated once."""
+        results = security_guard.validate_many(
+            ["SELECT email FROM users", "SELECT id FROM users"] * 2, workers=2
+        )
+        assert isinstance(results[0], ColumnAccessError)
+        assert results[2] is results[0]
+        assert results[1] is True and results[3] is True
+
+    def test_inline_by_default(self, security_guard, monkeypatch):
+        """Test that queries are validated inline unless workers is set."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("thread pool used without workers")
+
+        monkeypatch.setattr("langsec.core.security.ThreadPoolExecutor", fail)
+        results = security_guard.validate_many(
+            ["SELECT id FROM users", "SELECT email FROM users"]
+        )
+        assert results[0] is True
+        assert isinstance(results[1], ColumnAccessError)
+
+    def test_single_worker(self, security_guard):
+        """Test that a single worker validates the queries inline."""
+        assert security_guard.validate_many(["SELECT id FROM users"], workers=1) == [
+            True
+        ]
@@ -0,0 +1,58 @@
+import pytest
+from sqlglot.errors import ParseError, TokenError
+from langsec import SQLSecurityGuard
+from langsec.parser import _parse_outcome, cache_info, clear_cache, parse
+
+
+class TestParseCache:
+    def test_repeated_parse_returns_cached_expression(self):
+        """Test that parsing the same query twice reuses the expression."""
+        query = "SELECT id FROM users WHERE id = 42"
+        assert parse(query) is parse(query)
+
+    def test_cache_shared_across_guards(self, basic_schema):
+        """Test that distinct guards reuse the same parsed expression."""
+        query = "SELECT id, username FROM users WHERE id = 7"
+        clear_cache()
+        SQLSecurityGuard(schema=basic_schema).validate_query(query)
+        SQLSecurityGuard(schema=basic_schema).validate_query(query)
+        info = cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_parse_errors_are_cached(self):
+        """Test that a malformed query is parsed once and raises every time."""
+        query = "SELECT id FROM users WHERE ((("
+        clear_cache()
+        for _ in range(2):
+            with pytest.raises(ParseError) as exc_info:
+                parse(query)
+            assert exc_info.value.errors
+        info = cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_cached_parse_error_holds_no_traceback(self):
+        """Test that the cache keeps no traceback of a failed parse."""
+        query = "SELECT name FROM users WHERE ((("
+        with pytest.raises(ParseError) as first:
+            parse(query)
+        with pytest.raises(ParseError) as second:
+            parse(query)
+        assert second.value is not first.value
+        assert str(second.value) == str(first.value)
+        assert second.value.errors == first.value.errors
+        assert not any(
+            isinstance(item, BaseException) for item in _parse_outcome(query)
+        )
+
+    def test_token_errors_are_cached(self):
+        """Test that a query the tokenizer rejects is tokenized once."""
+        query = "SELECT id FROM users WHERE name = 'unterminated"
+        clear_cache()
+        for _ in range(2):
+            with pytest.raises(TokenError):
+                parse(query)
+        info = cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
@@ -0,0 +1,116 @@
+from langsec.schema.compiled import CompiledSchema
+from langsec.schema.security_schema import (
+    OPERATION_BITS,
+    ColumnSchema,
+    SecuritySchema,
+    TableSchema,
+    operations_mask,
+)
+from langsec.schema.sql.enums import AggregationType, Access, JoinType, Operation
+
+
+def _schema():
+    return SecuritySchema(
+        tables={
+            "Users": TableSchema(
+                columns={"Email": ColumnSchema(access=Access.DENIED)},
+                allowed_joins={"Orders": {JoinType.LEFT}},
+                default_allowed_join={JoinType.INNER},
+            ),
+        },
+        default_table_security_schema=TableSchema(
+            columns={"id": ColumnSchema(access=Access.READ)},
+            default_allowed_join={JoinType.CROSS},
+        ),
+        default_column_security_schema=ColumnSchema(access=Access.WRITE),
+    )
+
+
+class TestCompiledSchema:
+    def test_column_rule_matches_schema_lookup(self):
+        """Test that flat column lookups agree with the nested schema lookup."""
+        schema = _schema()
+        compiled = CompiledSchema(schema)
+        for table, column in [
+            ("users", "email"),
+            ("users", "id"),
+            ("orders", "id"),
+            ("orders", "total"),
+        ]:
+            rule = compiled.column_rule(table, column)
+            column_schema = schema.get_column_schema(table, column)
+            assert rule.access == column_schema.access
+            assert rule.allowed_operations == column_schema.allowed_operations
+            assert rule.operations_mask == column_schema.operations_mask
+
+    def test_join_rule_fallbacks(self):
+        """Test explicit join rules and both levels of default join rules."""
+        compiled = CompiledSchema(_schema())
+        assert compiled.join_rule("users", "orders") == {JoinType.LEFT}
+        assert compiled.join_rule("users", "products") == {JoinType.INNER}
+        assert compiled.join_rule("orders", "users") == {JoinType.CROSS}
+
+    def test_allows_join_matches_join_rule(self):
+        """Test that join checks agree with the join rules they are built from."""
+        compiled = CompiledSchema(_schema())
+        for table, other in [
+            ("users", "orders"),
+            ("users", "products"),
+            ("orders", "users"),
+        ]:
+            for join_type in JoinType:
+                assert compiled.allows_join(table, other, join_type) == (
+                    join_type in compiled.join_rule(table, other)
+                )
+
+    def test_selectable_columns(self):
+        """Test that only explicit columns allowing SELECT are selectable."""
+        schema = _schema()
+        schema.tables["Users"].columns["id"] = ColumnSchema(access=Access.READ)
+        compiled = CompiledSchema(schema)
+        assert compiled.selectable_columns == {("users", "id")}
+
+    def test_deletable_tables(self):
+        """Test that tables are deletable once any explicit column allows DELETE."""
+        schema = _schema()
+        assert not CompiledSchema(schema).deletable_tables
+
+        schema.tables["Users"].columns["id"] = ColumnSchema(
+            access=Access.WRITE, allowed_operations={Operation.DELETE}
+        )
+        assert CompiledSchema(schema).deletable_tables == {"users"}
+
+    def test_rule_fields_agree_after_in_place_change(self):
+        """Test that a rule's mask and operations agree after in-place changes."""
+        schema = _schema()
+        schema.tables["Users"].columns["id"] = ColumnSchema(access=Access.READ)
+        schema.tables["Users"].columns["id"].allowed_operations.discard(
+            Operation.SELECT
+        )
+        compiled = CompiledSchema(schema)
+        rule = compiled.column_rule("users", "id")
+        assert rule.operations_mask == operations_mask(rule.allowed_operations)
+        assert ("users", "id") not in compiled.selectable_columns
+        assert not rule.operations_mask & OPERATION_BITS[Operation.SELECT]
+
+    def test_restricts_aggregations(self):
+        """Test that aggregation limits are detected on any column rule."""
+        schema = _schema()
+        assert not CompiledSchema(schema).restricts_aggregations
+
+        schema.default_table_security_schema.columns["id"] = ColumnSchema(
+            access=Access.READ, allowed_aggregations={AggregationType.COUNT}
+        )
+        assert CompiledSchema(schema).restricts_aggregations
+
+    def test_table_names_are_lower_cased(self):
+        """Test that table membership uses lower-cased names."""
+        compiled = CompiledSchema(_schema())
+        assert compiled.has_table("users")
+        assert not compiled.has_table("orders")
+
+    def test_slots_prevent_dynamic_attributes(self):
+        """Test that compiled lookups carry no per-instance __dict__."""
+        compiled = CompiledSchema(_schema())
+        assert not hasattr(compiled, "__dict__")
+        assert not hasattr(compiled.default_column, "__dict__")
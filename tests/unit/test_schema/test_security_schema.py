@@ -0,0 +1,89 @@
+from langsec.schema.security_schema import (
+    OPERATION_BITS,
+    ColumnSchema,
+    SecuritySchema,
+    TableSchema,
+    operations_mask,
+)
+from langsec.schema.sql.enums import Access, Operation
+
+
+class TestTableLookup:
+    def test_table_lookup_ignores_case(self):
+        """Test that table schemas are found regardless of name casing."""
+        users = TableSchema()
+        schema = SecuritySchema(tables={"Users": users})
+        assert schema.get_table_schema("USERS") is users
+
+    def test_lookup_after_assignment(self):
+        """Test that lookups see tables assigned after construction."""
+        schema = SecuritySchema(tables={"users": TableSchema()})
+        orders = TableSchema()
+        schema.tables = {"orders": orders}
+        assert schema.get_table_schema("orders") is orders
+        default = schema.default_table_security_schema
+        assert schema.get_table_schema("users") is default
+
+    def test_table_added_in_place(self):
+        """Test that tables added to the dict after construction are found."""
+        schema = SecuritySchema(tables={"users": TableSchema()})
+        orders = TableSchema()
+        schema.tables["Orders"] = orders
+        assert schema.get_table_schema("ORDERS") is orders
+
+
+class TestColumnLookup:
+    def test_column_lookup_ignores_case(self):
+        """Test that column schemas are found regardless of name casing."""
+        email = ColumnSchema(access=Access.READ)
+        schema = SecuritySchema(tables={"users": TableSchema(columns={"Email": email})})
+        assert schema.get_column_schema("USERS", "email") is email
+
+    def test_missing_column_uses_default(self):
+        """Test that unknown columns and tables fall back to the default schema."""
+        schema = SecuritySchema(tables={"users": TableSchema()})
+        default = schema.default_column_security_schema
+        assert schema.get_column_schema("users", "missing") is default
+        assert schema.get_column_schema("missing", "id") is default
+
+    def test_column_added_in_place(self):
+        """Test that columns added to a table after construction are found."""
+        schema = SecuritySchema(tables={"users": TableSchema()})
+        email = ColumnSchema(access=Access.READ)
+        schema.tables["users"].columns["Email"] = email
+        assert schema.get_column_schema("users", "EMAIL") is email
+
+
+class TestOperationsMask:
+    def test_mask_matches_allowed_operations(self):
+        """Test that the bitmask encodes exactly the allowed operations."""
+        column = ColumnSchema(allowed_operations={Operation.SELECT, Operation.UPDATE})
+        assert column.operations_mask == operations_mask(
+            [Operation.SELECT, Operation.UPDATE]
+        )
+        assert not column.operations_mask & OPERATION_BITS[Operation.DELETE]
+
+    def test_mask_rebuilt_on_assignment(self):
+        """Test that assigning allowed operations refreshes the bitmask."""
+        column = ColumnSchema()
+        column.allowed_operations = {Operation.INSERT}
+        assert column.operations_mask == OPERATION_BITS[Operation.INSERT]
+
+    def test_mask_follows_in_place_changes(self):
+        """Test that the bitmask reflects operations added or removed in place."""
+        column = ColumnSchema(allowed_operations={Operation.SELECT})
+        column.allowed_operations.discard(Operation.SELECT)
+        assert column.operations_mask == 0
+        column.allowed_operations.add(Operation.UPDATE)
+        assert column.operations_mask == OPERATION_BITS[Operation.UPDATE]
+
+    def test_mask_follows_model_copy(self):
+        """Test that a copy with updated operations reports their bitmask."""
+        column = ColumnSchema(allowed_operations={Operation.SELECT})
+        copy = column.model_copy(update={"allowed_operations": {Operation.UPDATE}})
+        assert copy.operations_mask == OPERATION_BITS[Operation.UPDATE]
+
+    def test_unchecked_builds_mask(self):
+        """Test that unchecked construction still builds the bitmask."""
+        column = ColumnSchema.unchecked(allowed_operations={Operation.SELECT})
+        assert column.operations_mask == OPERATION_BITS[Operation.SELECT]
@@ -0,0 +1,54 @@
+import pytest
+from sqlglot import parse_one
+from langsec.exceptions.errors import JoinViolationError, QueryComplexityError
+from langsec.validators.facts import QueryFacts
+
+
+class TestQueryFacts:
+    def test_collects_nodes_in_single_walk(self):
+        """Test that tables, columns, joins and aggregations are collected."""
+        parsed = parse_one(
+            """
+            SELECT u.username, SUM(o.amount)
+            FROM users u
+            JOIN orders o ON u.id = o.user_id
+            GROUP BY u.username
+            """
+        )
+        facts = QueryFacts(parsed)
+
+        assert [t.name for t in facts.tables] == ["users", "orders"]
+        assert {c.name for c in facts.columns} == {"username", "amount", "id", "user_id"}
+        assert len(facts.joins) == 1
+        assert len(facts.aggregations) == 1
+        assert facts.subqueries == []
+
+    def test_subqueries_exclude_root_and_unions(self):
+        """Test that only nested SELECTs are reported as subqueries."""
+        union = QueryFacts(parse_one("SELECT id FROM users UNION SELECT id FROM orders"))
+        assert union.subqueries == []
+        assert union.unions == [union.parsed]
+
+        nested = QueryFacts(
+            parse_one("SELECT id FROM users WHERE id IN (SELECT user_id FROM orders)")
+        )
+        assert len(nested.subqueries) == 1
+
+    def test_slots_prevent_dynamic_attributes(self):
+        """Test that QueryFacts instances carry no per-instance __dict__."""
+        facts = QueryFacts(parse_one("SELECT id FROM users"))
+        assert not hasattr(facts, "__dict__")
+
+    def test_join_limit_stops_walk(self):
+        """Test that exceeding max_joins raises while collecting facts."""
+        parsed = parse_one(
+            "SELECT * FROM a JOIN b ON a.id = b.id JOIN c ON b.id = c.id"
+        )
+        with pytest.raises(JoinViolationError, match=r"\(2\) exceeds .* \(1\)"):
+            QueryFacts(parsed, max_joins=1)
+
+    def test_disallowed_subquery_stops_walk(self):
+        """Test that a nested SELECT raises when subqueries are not allowed."""
+        parsed = parse_one("SELECT id FROM users WHERE id IN (SELECT 1)")
+        with pytest.raises(QueryComplexityError, match="Subqueries are not allowed"):
+            QueryFacts(parsed, allow_subqueries=False)
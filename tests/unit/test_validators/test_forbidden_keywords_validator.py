@@ -1,5 +1,8 @@
 import pytest
+from langsec import SQLSecurityGuard, SecuritySchema
 from langsec.exceptions.errors import QueryComplexityError
+from langsec.schema.security_schema import ColumnSchema
+from langsec.schema.sql.enums import Access
 
 def test_forbidden_keyword_drop(security_guard):
     with pytest.raises(QueryComplexityError, match="Forbidden keyword found: DROP"):
@@ -32,3 +35,20 @@ def test_forbidden_keyword_sysadmin(security_guard):
 def test_forbidden_keyword_dbadmin(security_guard):
     with pytest.raises(QueryComplexityError, match="Forbidden keyword found: DBADMIN"):
         security_guard.validate_query("DBADMIN some_command;")
+
+def test_forbidden_keyword_configured_lowercase():
+    schema = SecuritySchema(
+        default_column_security_schema=ColumnSchema(access=Access.READ),
+        forbidden_keywords={"sleep"},
+    )
+    assert schema.forbidden_keywords == {"SLEEP"}
+    with pytest.raises(QueryComplexityError, match="Forbidden keyword found: SLEEP"):
+        SQLSecurityGuard(schema).validate_query("SELECT Sleep(5) FROM users")
+
+def test_forbidden_keyword_added_in_place_lowercase():
+    schema = SecuritySchema(
+        default_column_security_schema=ColumnSchema(access=Access.READ),
+    )
+    schema.forbidden_keywords.add("pg_sleep")
+    with pytest.raises(QueryComplexityError, match="Forbidden keyword found: PG_SLEEP"):
+        SQLSecurityGuard(schema).validate_query("SELECT pg_sleep(5) FROM users")
@@ -14,3 +14,9 @@ class TestSQLInjection:
         for query in queries:
             with pytest.raises((SQLInjectionError, QueryComplexityError, TableAccessError)):
                 security_guard.validate_query(query)
+
+    def test_quote_breakout_in_select_literal(self, security_guard):
+        """Test that literals in the select list are still checked individually."""
+        query = "SELECT 'x''; SHUTDOWN WITH NOWAIT', id FROM users"
+        with pytest.raises(SQLInjectionError, match="unbalanced quotes"):
+            security_guard.validate_query(query)
@@ -1,4 +1,7 @@
+import time
+
 import pytest
+from sqlglot.errors import TokenError
 from langsec.exceptions.errors import (
     TableAccessError,
     ColumnAccessError,
@@ -6,6 +9,8 @@ from langsec.exceptions.errors import (
     QueryComplexityError,
 )
 from langsec.core.security import SQLSecurityGuard
+from langsec.schema.security_schema import ColumnSchema, SecuritySchema, TableSchema
+from langsec.schema.sql.enums import Access
 
 
 class TestBasicQueries:
@@ -307,6 +312,26 @@ class TestSubqueries:
             security_guard_no_subqueries.validate_query(query)
         assert "Subqueries are not allowed" in str(exc.value)
 
+    def test_select_in_literal_allowed(self, security_guard_no_subqueries):
+        """Test that a parenthesized SELECT inside a string is not a subquery."""
+        query = "SELECT id FROM users WHERE username = '(select me)'"
+        assert security_guard_no_subqueries.validate_query(query)
+
+    def test_unterminated_comments_scanned_in_linear_time(self):
+        """Test that unterminated comments do not make the subquery prefilter quadratic."""
+        guard = SQLSecurityGuard(
+            schema=SecuritySchema(
+                default_column_security_schema=ColumnSchema(access=Access.READ),
+                allow_subqueries=False,
+            )
+        )
+        assert guard.query_validator.compiled.table_names == frozenset()
+        query = "SELECT id FROM users WHERE " + "/* " * 20000
+        start = time.perf_counter()
+        with pytest.raises(TokenError):
+            guard.validate_query(query)
+        assert time.perf_counter() - start < 1
+
 
 class TestQueryTypes:
     def test_allowed_select(self, security_guard):
@@ -418,3 +443,67 @@ class TestColumnAccessWithMixedAccess:
                 DELETE FROM audit_log
                 WHERE action = 'test'
             """)
+
+    def test_select_without_select_permission(self, mixed_access_guard):
+        """Test that a plain SELECT still checks columns without SELECT permission."""
+        with pytest.raises(ColumnAccessError):
+            mixed_access_guard.validate_query(
+                "SELECT id, last_login FROM users WHERE id = 1"
+            )
+
+
+class TestValidatorPipeline:
+    def test_disabled_rules_are_skipped(self, security_guard):
+        """Test that validators without enabled rules are left out of the pipeline."""
+        validators = security_guard.query_validator.validators
+        assert security_guard.query_validator.subqueries_validator not in validators
+        assert security_guard.query_validator.table_validator in validators
+
+    def test_enabled_rules_are_kept(self, security_guard_no_subqueries):
+        """Test that enabled validators are part of the pipeline."""
+        query_validator = security_guard_no_subqueries.query_validator
+        assert query_validator.subqueries_validator in query_validator.validators
+
+    def test_column_rules_checked_before_joins(self, security_guard):
+        """Test that a denied column is reported before a disallowed join."""
+        query = """
+            SELECT users.username, orders.secret
+            FROM users
+            FULL JOIN orders ON users.id = orders.user_id
+        """
+        with pytest.raises(ColumnAccessError):
+            security_guard.validate_query(query)
+
+
+class TestTablePrefilter:
+    def test_unknown_table_rejected_before_parsing(self, security_guard):
+        """Test that an unknown table is rejected even if the query cannot parse."""
+        query = "SELECT id FROM nonexistent_table WHERE ((("
+        with pytest.raises(TableAccessError):
+            security_guard.validate_query(query)
+
+    def test_from_outside_table_references(self, security_guard):
+        """Test that FROM in literals and expressions is not a table reference."""
+        query = """
+            SELECT id, EXTRACT(YEAR FROM created_at)
+            FROM users
+            WHERE username IS DISTINCT FROM 'from secrets'
+        """
+        assert security_guard.validate_query(query)
+
+    def test_unterminated_comments_scanned_in_linear_time(self):
+        """Test that unterminated comments do not make the prefilter quadratic."""
+        guard = SQLSecurityGuard(
+            schema=SecuritySchema(
+                tables={
+                    "users": TableSchema(
+                        columns={"id": ColumnSchema(access=Access.READ)}
+                    )
+                }
+            )
+        )
+        query = "SELECT id FROM users WHERE " + "/* " * 20000
+        start = time.perf_counter()
+        with pytest.raises(TokenError):
+            guard.validate_query(query)
+        assert time.perf_counter() - start < 1
@@ -72,34 +72,17 @@ class TestColumnAccessWithDefaultContext:
 
 
 class TestJoinsWithDefaultContext:
-    def test_valid_joins(self, security_guard_allow_all):
+    # RIGHT JOIN is equivalent to LEFT JOIN from the orders perspective
+    @pytest.mark.parametrize("join_type", ["RIGHT", "LEFT", "INNER"])
+    def test_valid_joins(self, security_guard_allow_all, join_type):
         """Test that valid joins are allowed."""
-        # Test RIGHT JOIN (equivalent to LEFT JOIN from orders perspective)
-        query1 = """
+        query = f"""
             SELECT users.username, orders.amount
             FROM users
-            RIGHT JOIN orders ON users.id = orders.user_id
+            {join_type} JOIN orders ON users.id = orders.user_id
             WHERE users.created_at > '2024-01-01'
         """
-        security_guard_allow_all.validate_query(query1)  # Should not raise
-
-        # Test LEFT JOIN
-        query2 = """
-            SELECT users.username, orders.amount
-            FROM users
-            LEFT JOIN orders ON users.id = orders.user_id
-            WHERE users.created_at > '2024-01-01'
-        """
-        security_guard_allow_all.validate_query(query2)  # Should not raise
-
-        # Test INNER JOIN
-        query3 = """
-            SELECT users.username, orders.amount
-            FROM users
-            INNER JOIN orders ON users.id = orders.user_id
-            WHERE users.created_at > '2024-01-01'
-        """
-        security_guard_allow_all.validate_query(query3)  # Should not raise
+        security_guard_allow_all.validate_query(query)  # Should not raise
 
     def test_allowed_join(self, security_guard_allow_all):
         """Test allowed JOIN operations."""